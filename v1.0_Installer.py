@@ -44,12 +44,20 @@ Usage Examples:
 
 import os
 import platform
+import re
 import subprocess
 import shutil
 import time
 import argparse
+import glob
+import http.client
+import struct
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+import urllib.error
 import urllib.request
 import zipfile
+import zlib
 import tempfile
 
 # Global configuration
@@ -57,10 +65,55 @@ SLOW_MODE = False
 SLOW_DELAY = 2  # seconds
 CUSTOM_PATH = None
 
+# User directories, resolved once
+HOME_DIR = os.path.expanduser("~")
+PYROCLAST_DIR = os.path.join(HOME_DIR, "pyroclast")
+
+# KEY=value or KEY="value" assignments in /etc/os-release
+OS_RELEASE_PATTERN = re.compile(r'^[ \t]*([A-Z0-9_]+)="?([^"\n]*)"?', re.MULTILINE)
+
+# Distribution families, matched against ID_LIKE tokens first and then ID
+ID_LIKE_MAP = {
+    "debian": "debian",
+    "fedora": "fedora",
+    "arch": "arch",
+    "void": "void",
+    "solus": "solus",
+}
+ID_MAP = {
+    "debian": "debian",
+    "ubuntu": "debian",
+    "linuxmint": "debian",
+    "fedora": "fedora",
+    "centos": "fedora",
+    "rhel": "fedora",
+    "arch": "arch",
+    "manjaro": "arch",
+    "cachyos": "arch",
+    "void": "void",
+    "solus": "solus",
+}
+
+# Where pacman records installed packages (one <name>-<version> directory each)
+PACMAN_LOCAL_DB = "/var/lib/pacman/local"
+
 # GitHub commit and URL constants
 COMMIT_HASH = "a621b3f4f154e4a1ba8e07d63827e1e757a05bbd"
 ZIP_URL = f"https://github.com/crosire/reshade-shaders/archive/{COMMIT_HASH}.zip"
 
+# ZIP streaming constants
+ZIP_CHUNK_SIZE = 1024 * 1024  # bytes read from the HTTP response at a time
+ZIP_LOCAL_HEADER = struct.Struct("<5H3L2H")  # local file header after its signature
+ZIP_LOCAL_SIGNATURE = b"PK\x03\x04"
+ZIP_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+ZIP_END_SIGNATURES = (b"PK\x01\x02", b"PK\x05\x06")  # central directory / end record
+ZIP_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")  # central directory file header
+ZIP_END_RECORD = struct.Struct("<4s4H2LH")  # end of central directory record
+ZIP_TAIL_SIZE = 64 * 1024  # bytes requested from the end of the archive to find its central directory
+
+# PATH lookups are repeated for the same few names, so resolve each one only once.
+cached_which = lru_cache(maxsize=None)(shutil.which)
+
 
 def slow_log(message):
     """Logs a message and optionally pauses (if slow mode is enabled)."""
@@ -75,36 +128,16 @@ def detect_distro():
     distro = "unknown"
     try:
         with open("/etc/os-release", "r") as f:
-            lines = f.readlines()
-        info = {}
-        for line in lines:
-            if "=" in line:
-                key, value = line.strip().split("=", 1)
-                info[key.lower()] = value.strip('"').lower()
+            text = f.read()
+        info = {key.lower(): value.strip().lower() for key, value in OS_RELEASE_PATTERN.findall(text)}
         slow_log("Parsed /etc/os-release: " + str(info))
 
-        if "id_like" in info:
-            if "debian" in info["id_like"]:
-                distro = "debian"
-            elif "fedora" in info["id_like"]:
-                distro = "fedora"
-            elif "arch" in info["id_like"]:
-                distro = "arch"
-            elif "void" in info["id_like"]:
-                distro = "void"
-            elif "solus" in info["id_like"]:
-                distro = "solus"
-        if distro == "unknown" and "id" in info:
-            if info["id"] in ["debian", "ubuntu", "linuxmint"]:
-                distro = "debian"
-            elif info["id"] in ["fedora", "centos", "rhel"]:
-                distro = "fedora"
-            elif info["id"] in ["arch", "manjaro", "cachyos"]:
-                distro = "arch"
-            elif info["id"] == "void":
-                distro = "void"
-            elif info["id"] == "solus":
-                distro = "solus"
+        for token in info.get("id_like", "").split():
+            if token in ID_LIKE_MAP:
+                distro = ID_LIKE_MAP[token]
+                break
+        if distro == "unknown":
+            distro = ID_MAP.get(info.get("id"), "unknown")
     except Exception as e:
         slow_log("Error reading /etc/os-release: " + str(e))
     slow_log("Determined distribution: " + distro)
@@ -118,28 +151,42 @@ def is_vkbasalt_installed():
     """
     slow_log("Checking if vkbasalt is installed (searching in PATH)...")
     for binary in ["vkbasalt", "vkBasalt"]:
-        if shutil.which(binary):
+        if cached_which(binary):
             slow_log(f"Found binary {binary} in PATH.")
             return True
 
     slow_log("Not found in PATH; checking known locations...")
-    found = False
-    known_locations = {
-        "/usr/lib/libvkbasalt.so": "Library file",
-        "/usr/share/vulkan/implicit_layer.d/vkBasalt.json": "Vulkan layer config",
-        "/usr/share/vkbasalt/vkBasalt.conf.example": "Example config file",
-    }
+    known_locations = (
+        ("/usr/lib/libvkbasalt.so", "Library file"),
+        ("/usr/share/vulkan/implicit_layer.d/vkBasalt.json", "Vulkan layer config"),
+        ("/usr/share/vkbasalt/vkBasalt.conf.example", "Example config file"),
+    )
     if CUSTOM_PATH:
-        known_locations[CUSTOM_PATH] = "Custom provided path"
-    for path, desc in known_locations.items():
+        known_locations += ((CUSTOM_PATH, "Custom provided path"),)
+    # The first existing location is enough to answer.
+    for path, desc in known_locations:
         if os.path.exists(path):
             slow_log(f"Found {desc} at {path}.")
-            found = True
-    if found:
-        slow_log("vkBasalt detected (Vulkan layer installed).")
-    else:
-        slow_log("vkbasalt not found in expected locations.")
-    return found
+            slow_log("vkBasalt detected (Vulkan layer installed).")
+            return True
+    slow_log("vkbasalt not found in expected locations.")
+    return False
+
+
+def pacman_installed_version(package):
+    """
+    Returns the installed version of a package by reading its desc file in pacman's
+    local database, or None if the package is not installed.
+    """
+    for entry in glob.iglob(os.path.join(PACMAN_LOCAL_DB, f"{package}-*")):
+        try:
+            with open(os.path.join(entry, "desc"), "r") as f:
+                fields = f.read().split("\n")
+            if fields[fields.index("%NAME%") + 1] == package:
+                return fields[fields.index("%VERSION%") + 1]
+        except (OSError, ValueError):
+            continue
+    return None
 
 
 def is_vkbasalt_up_to_date_with_aur(aur_helper):
@@ -147,8 +194,10 @@ def is_vkbasalt_up_to_date_with_aur(aur_helper):
     Checks if the AUR-installed vkBasalt is up-to-date using the specified AUR helper.
     Returns True if the installed version matches the latest available version.
     """
+    installed = pacman_installed_version("vkbasalt")
+    if installed is None:
+        return False
     try:
-        installed = subprocess.check_output([aur_helper, "-Q", "vkbasalt"]).decode().strip().split()[1]
         available_output = subprocess.check_output([aur_helper, "-Si", "vkbasalt"]).decode()
         for line in available_output.splitlines():
             if line.lower().startswith("version"):
@@ -167,7 +216,7 @@ def is_vkbasalt_up_to_date_with_aur(aur_helper):
 def install_vkbasalt(distro, use_flatpak, flatpak_pkg, aur_helper):
     """Installs vkBasalt using the appropriate method for the distro or via Flatpak."""
     if use_flatpak:
-        if not shutil.which("flatpak"):
+        if not cached_which("flatpak"):
             slow_log("Flatpak is not installed. Cannot proceed with Flatpak installation.")
             return
         slow_log("Installing vkbasalt via Flatpak...")
@@ -183,8 +232,8 @@ def install_vkbasalt(distro, use_flatpak, flatpak_pkg, aur_helper):
     try:
         if distro == "debian":
             slow_log("Installing vkbasalt via apt-get...")
-            subprocess.run(["sudo", "apt-get", "update"], check=True)
-            subprocess.run(["sudo", "apt-get", "install", "-y", "vkbasalt"], check=True)
+            # One sudo invocation, so authentication happens once for both steps.
+            subprocess.run(["sudo", "sh", "-c", "apt-get update && apt-get install -y vkbasalt"], check=True)
         elif distro == "fedora":
             slow_log("Installing vkbasalt via dnf...")
             subprocess.run(["sudo", "dnf", "install", "-y", "vkbasalt"], check=True)
@@ -194,10 +243,10 @@ def install_vkbasalt(distro, use_flatpak, flatpak_pkg, aur_helper):
                 subprocess.run(["sudo", "pacman", "-Syu", "vkbasalt", "--noconfirm"], check=True)
             except subprocess.CalledProcessError:
                 slow_log("Pacman did not find/update vkbasalt. Checking for an AUR helper...")
-                helper_used = aur_helper if aur_helper and shutil.which(aur_helper) else None
+                helper_used = aur_helper if aur_helper and cached_which(aur_helper) else None
                 if not helper_used:
                     for helper in ["yay", "paru"]:
-                        if shutil.which(helper):
+                        if cached_which(helper):
                             helper_used = helper
                             break
                 if helper_used:
@@ -213,8 +262,7 @@ def install_vkbasalt(distro, use_flatpak, flatpak_pkg, aur_helper):
             subprocess.run(["sudo", "xbps-install", "-S", "vkbasalt"], check=True)
         elif distro == "solus":
             slow_log("Installing vkbasalt via eopkg...")
-            subprocess.run(["sudo", "eopkg", "update"], check=True)
-            subprocess.run(["sudo", "eopkg", "install", "vkbasalt"], check=True)
+            subprocess.run(["sudo", "sh", "-c", "eopkg update && eopkg install vkbasalt"], check=True)
         else:
             slow_log("Unsupported Linux distribution. Cannot install vkbasalt automatically.")
     except subprocess.CalledProcessError as e:
@@ -224,7 +272,7 @@ def install_vkbasalt(distro, use_flatpak, flatpak_pkg, aur_helper):
 def uninstall_vkbasalt(distro, use_flatpak, flatpak_pkg, aur_helper):
     """Uninstalls vkBasalt using the appropriate package manager or Flatpak."""
     if use_flatpak:
-        if not shutil.which("flatpak"):
+        if not cached_which("flatpak"):
             slow_log("Flatpak is not installed. Cannot proceed with uninstallation.")
             return
         slow_log("Uninstalling vkbasalt via Flatpak...")
@@ -244,10 +292,10 @@ def uninstall_vkbasalt(distro, use_flatpak, flatpak_pkg, aur_helper):
                 subprocess.run(["sudo", "pacman", "-Rns", "--noconfirm", "vkbasalt"], check=True)
             except subprocess.CalledProcessError:
                 slow_log("Pacman removal failed. Checking for an AUR helper...")
-                helper_used = aur_helper if aur_helper and shutil.which(aur_helper) else None
+                helper_used = aur_helper if aur_helper and cached_which(aur_helper) else None
                 if not helper_used:
                     for helper in ["yay", "paru"]:
-                        if shutil.which(helper):
+                        if cached_which(helper):
                             helper_used = helper
                             break
                 if helper_used:
@@ -271,15 +319,19 @@ def setup_vkbasalt_config():
     Ensures the user's vkBasalt configuration exists by copying the example config
     to ~/.config/vkBasalt/vkBasalt.conf if it doesn't already exist.
     """
-    config_dir = os.path.expanduser("~/.config/vkBasalt")
+    config_dir = os.path.join(HOME_DIR, ".config", "vkBasalt")
     config_file = os.path.join(config_dir, "vkBasalt.conf")
     example_file = "/usr/share/vkBasalt/vkBasalt.conf.example"
 
-    if not os.path.exists(config_dir):
-        slow_log(f"Creating configuration directory at {config_dir}.")
-        os.makedirs(config_dir, exist_ok=True)
-    else:
+    # A single mkdir answers both cases; ~/.config itself is only created if missing.
+    try:
+        os.mkdir(config_dir)
+        slow_log(f"Created configuration directory at {config_dir}.")
+    except FileExistsError:
         slow_log(f"Configuration directory exists at {config_dir}.")
+    except FileNotFoundError:
+        os.makedirs(config_dir)
+        slow_log(f"Created configuration directory at {config_dir}.")
 
     if not os.path.exists(config_file):
         if os.path.exists(example_file):
@@ -300,42 +352,344 @@ def create_pyroclast_directories():
       - ~/pyroclast/textures/ for ReShade texture files.
       - ~/pyroclast/lut/ for LUT files.
     """
-    pyroclast_main = os.path.expanduser("~/pyroclast")
+    pyroclast_main = PYROCLAST_DIR
     backup_dir = os.path.join(pyroclast_main, "backupfiles")
     shaders_dir = os.path.join(pyroclast_main, "shaders")
     textures_dir = os.path.join(pyroclast_main, "textures")
     lut_dir = os.path.join(pyroclast_main, "lut")
 
+    # pyroclast_main comes first, so each later directory's parent already exists
+    # and a single mkdir both creates it and detects an existing one.
     directories = [pyroclast_main, backup_dir, shaders_dir, textures_dir, lut_dir]
     for directory in directories:
-        if not os.path.exists(directory):
-            slow_log(f"Creating directory: {directory}")
-            os.makedirs(directory, exist_ok=True)
-        else:
+        try:
+            os.mkdir(directory)
+            slow_log(f"Created directory: {directory}")
+        except FileExistsError:
             slow_log(f"Directory already exists: {directory}")
 
 
-def download_and_extract_zip(url, extract_to):
+class ZipStream:
+    """
+    Wraps a non-seekable stream (such as an HTTP response) so ZIP members can be
+    read one after another through their local file headers.
+    """
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.buffer = b""
+        self.offset = 0
+
+    def at_end(self):
+        """Returns True once every byte of the stream has been consumed."""
+        if self.offset < len(self.buffer):
+            return False
+        self.buffer = self.fileobj.read(ZIP_CHUNK_SIZE)
+        self.offset = 0
+        return not self.buffer
+
+    def read_exact(self, size):
+        """Reads exactly size bytes, raising zipfile.BadZipFile if the stream ends early."""
+        available = len(self.buffer) - self.offset
+        if available < size:
+            chunk = self.fileobj.read(max(size - available, ZIP_CHUNK_SIZE))
+            self.buffer = self.buffer[self.offset:] + chunk
+            self.offset = 0
+            if len(self.buffer) < size:
+                raise zipfile.BadZipFile("ZIP stream ended unexpectedly.")
+        data = self.buffer[self.offset:self.offset + size]
+        self.offset += size
+        return data
+
+    def read_chunk(self):
+        """Returns the next available bytes, or an empty bytes object at the end of the stream."""
+        if self.offset < len(self.buffer):
+            data = self.buffer[self.offset:]
+            self.buffer = b""
+            self.offset = 0
+            return data
+        return self.fileobj.read(ZIP_CHUNK_SIZE)
+
+    def unread(self, data):
+        """Pushes data back so the next read returns it first."""
+        self.buffer = data + self.buffer[self.offset:]
+        self.offset = 0
+
+
+def member_path(root, name):
+    """
+    Returns the path a ZIP member should be extracted to, refusing names that would
+    escape root (Zip Slip). root must be canonical and end with os.sep, so the check
+    is a plain string prefix test. normpath drops the trailing separator, so it is
+    added back to accept entries that resolve to root itself (such as "./").
+    """
+    target = os.path.normpath(os.path.join(root, name))
+    if not (target + os.sep).startswith(root):
+        raise zipfile.BadZipFile(f"Refusing to extract {name} outside of {root}.")
+    return target
+
+
+def inflate_streamed_member(zip_stream):
+    """
+    Inflates a member whose sizes are only stored in the trailing data descriptor.
+    Returns the uncompressed data and the CRC-32 from the descriptor.
+    """
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    parts = []
+    while not decompressor.eof:
+        chunk = zip_stream.read_chunk()
+        if not chunk:
+            raise zipfile.BadZipFile("ZIP stream ended unexpectedly.")
+        parts.append(decompressor.decompress(chunk))
+    zip_stream.unread(decompressor.unused_data)
+
+    descriptor = zip_stream.read_exact(12)
+    if descriptor[:4] == ZIP_DESCRIPTOR_SIGNATURE:
+        descriptor = descriptor[4:] + zip_stream.read_exact(4)
+    crc = struct.unpack("<L", descriptor[:4])[0]
+    return b"".join(parts), crc
+
+
+def write_file(path, data):
+    """
+    Writes data to path using raw os.open/os.write calls. Unlike open(), this skips the
+    fstat and isatty probes, which adds up over thousands of small files.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_member(target, name, data, method, crc):
+    """Inflates a member's data if needed, verifies its CRC-32 and writes it to target."""
+    if method == zipfile.ZIP_DEFLATED:
+        data = zlib.decompress(data, -zlib.MAX_WBITS)
+    if zlib.crc32(data) != crc:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for {name}.")
+    write_file(target, data)
+
+
+def extract_zip_stream(fileobj, extract_to, prefixes=None):
+    """
+    Extracts a ZIP archive from a non-seekable stream while it is still being received.
+    Members are located through their local file headers, because the central directory
+    only arrives once the whole archive has been downloaded. Directories are created
+    up front by the reading thread; inflating and writing files runs on a thread pool.
+    At most two members per worker wait to be written, and a failed write stops the
+    download straight away.
+    If prefixes is given, only members whose names start with one of them are extracted.
+    The stream may also end right after a member, as with a ranged download.
+    """
+    zip_stream = ZipStream(fileobj)
+    root = os.path.join(os.path.realpath(extract_to), "")
+    created_dirs = set()
+    max_workers = os.cpu_count() or 1
+    pending = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while not zip_stream.at_end():
+            signature = zip_stream.read_exact(4)
+            if signature in ZIP_END_SIGNATURES:
+                break
+            if signature != ZIP_LOCAL_SIGNATURE:
+                raise zipfile.BadZipFile("Unexpected data in ZIP stream.")
+
+            (_, flags, method, _, _, crc, compressed_size, _,
+             name_length, extra_length) = ZIP_LOCAL_HEADER.unpack(zip_stream.read_exact(ZIP_LOCAL_HEADER.size))
+            name = zip_stream.read_exact(name_length).decode("utf-8" if flags & 0x800 else "cp437")
+            zip_stream.read_exact(extra_length)
+            selected = prefixes is None or name.startswith(prefixes)
+
+            if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                raise zipfile.BadZipFile(f"Unsupported compression method {method} for {name}.")
+            if flags & 0x08:
+                # The member's end is only known once it has been inflated.
+                if method != zipfile.ZIP_DEFLATED:
+                    raise zipfile.BadZipFile(f"Cannot stream stored member {name} without its size.")
+                data, crc = inflate_streamed_member(zip_stream)
+                method = zipfile.ZIP_STORED
+            else:
+                if compressed_size == 0xFFFFFFFF:
+                    raise zipfile.BadZipFile(f"ZIP64 member {name} is not supported.")
+                data = zip_stream.read_exact(compressed_size)
+            if not selected:
+                continue
+
+            target = member_path(root, name)
+            is_dir = name.endswith("/")
+            directory = target if is_dir else os.path.dirname(target)
+            if directory not in created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                created_dirs.add(directory)
+            if is_dir:
+                continue
+
+            pending.add(executor.submit(write_member, target, name, data, method, crc))
+            if len(pending) > 2 * max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            else:
+                done = {future for future in pending if future.done()}
+                pending -= done
+            for future in done:
+                future.result()
+
+    for future in pending:
+        future.result()
+
+
+def range_request(url, byte_range, etag=None):
+    """
+    Builds a Range request for url. With an etag, If-Range makes the server answer
+    200 with the full body instead of 206 if the archive has changed since.
+    """
+    headers = {"Range": f"bytes={byte_range}"}
+    if etag:
+        headers["If-Range"] = etag
+    return urllib.request.Request(url, headers=headers)
+
+
+def read_central_directory(url):
+    """
+    Reads the central directory of a remote ZIP archive using HTTP Range requests.
+    Returns a list of (name, local header offset) pairs, the central directory offset
+    and the archive's ETag, or None if the server does not honour Range requests
+    or gives no strong ETag to tie follow-up requests to the same archive bytes.
+    """
+    with urllib.request.urlopen(range_request(url, f"-{ZIP_TAIL_SIZE}")) as response:
+        if response.status != 206:
+            return None
+        etag = response.headers.get("ETag")
+        total_size = response.headers.get("Content-Range", "").rpartition("/")[2]
+        tail = response.read()
+    if not etag or etag.startswith("W/") or not total_size.isdigit():
+        return None
+    tail_start = int(total_size) - len(tail)
+
+    end = tail.rfind(ZIP_END_SIGNATURES[1])
+    if end < 0 or len(tail) - end < ZIP_END_RECORD.size:
+        raise zipfile.BadZipFile("End of central directory record not found.")
+    _, _, _, _, _, directory_size, directory_offset, _ = ZIP_END_RECORD.unpack_from(tail, end)
+    if directory_offset == 0xFFFFFFFF:
+        return None  # ZIP64 archives are left to the full download.
+
+    if directory_offset >= tail_start:
+        directory = tail[directory_offset - tail_start:directory_offset - tail_start + directory_size]
+    else:
+        directory_range = f"{directory_offset}-{directory_offset + directory_size - 1}"
+        with urllib.request.urlopen(range_request(url, directory_range, etag)) as response:
+            if response.status != 206:
+                return None
+            directory = response.read()
+
+    members = []
+    position = 0
+    while position < len(directory):
+        if len(directory) - position < ZIP_CENTRAL_HEADER.size:
+            raise zipfile.BadZipFile("Truncated central directory.")
+        (signature, _, _, flags, _, _, _, _, _, _, name_length, extra_length,
+         comment_length, _, _, _, header_offset) = ZIP_CENTRAL_HEADER.unpack_from(directory, position)
+        if signature != ZIP_END_SIGNATURES[0]:
+            raise zipfile.BadZipFile("Malformed central directory.")
+        position += ZIP_CENTRAL_HEADER.size
+        name = directory[position:position + name_length].decode("utf-8" if flags & 0x800 else "cp437")
+        members.append((name, header_offset))
+        position += name_length + extra_length + comment_length
+    return members, directory_offset, etag
+
+
+def open_member_range(url, prefixes):
+    """
+    Opens only the byte range of a remote ZIP archive that holds the members under the
+    given prefixes, so unselected directories are never downloaded.
+    Returns None if the server does not support this, in which case the caller should
+    fall back to downloading the whole archive.
+    """
+    central_directory = read_central_directory(url)
+    if central_directory is None:
+        return None
+    members, directory_offset, etag = central_directory
+    selected = [offset for name, offset in members if name.startswith(prefixes)]
+    if not selected:
+        return None
+
+    # The range ends where the next member after the last selected one begins.
+    first, last = min(selected), max(selected)
+    end = min((offset for _, offset in members if offset > last), default=directory_offset)
+    response = urllib.request.urlopen(range_request(url, f"{first}-{end - 1}", etag))
+    if response.status != 206:
+        response.close()
+        return None
+    slow_log(f"Fetching {end - first} of {directory_offset} archive bytes for the selected directories.")
+    return response
+
+
+def download_and_extract_zip(url, extract_to, prefixes=None):
     """
     Downloads a ZIP archive from the given URL and extracts its contents to the specified directory.
+    Extraction happens while the archive is streamed, so it overlaps with the download.
+    If prefixes is given, only members under those prefixes are fetched (when the server
+    supports Range requests) and extracted. If the ranged fetch fails, the whole archive
+    is downloaded instead.
     """
-    slow_log(f"Downloading from {url} ...")
-    zip_path = os.path.join(extract_to, "download.zip")
-    urllib.request.urlretrieve(url, zip_path)
-    slow_log("Download complete. Extracting...")
-    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        zip_ref.extractall(extract_to)
-    os.remove(zip_path)
+    slow_log(f"Downloading and extracting from {url} ...")
+    if prefixes:
+        try:
+            response = open_member_range(url, prefixes)
+            if response is not None:
+                with response:
+                    extract_zip_stream(response, extract_to, prefixes)
+                slow_log("Extraction complete.")
+                return
+        except (zipfile.BadZipFile, urllib.error.URLError, http.client.HTTPException, UnicodeDecodeError) as e:
+            # The ranged fetch is only an optimization, so any failure falls back to the full download.
+            slow_log(f"Ranged download failed ({e}); downloading the whole archive instead.")
+
+    with urllib.request.urlopen(url) as response:
+        extract_zip_stream(response, extract_to, prefixes)
     slow_log("Extraction complete.")
 
 
+def link_or_copy(src, dst):
+    """
+    Hard-links src to dst, replacing any existing file at dst.
+    Falls back to shutil.copy2 when linking is not possible (e.g. across filesystems).
+    """
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        os.remove(dst)
+        link_or_copy(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def fast_copytree(src, dst):
+    """
+    Copies a directory tree in three phases: walk the source once, create every
+    destination directory once, then hard-link (or copy) the files on a thread pool.
+    Existing directories and files in dst are reused or replaced, like
+    shutil.copytree with dirs_exist_ok=True.
+    """
+    files = []
+    for dirpath, _, filenames in os.walk(src):
+        target_dir = os.path.normpath(os.path.join(dst, os.path.relpath(dirpath, src)))
+        os.makedirs(target_dir, exist_ok=True)
+        files.extend((os.path.join(dirpath, name), os.path.join(target_dir, name)) for name in filenames)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda paths: link_or_copy(*paths), files))
+
+
 def copy_directory(src, dst):
     """
-    Copies the contents of the source directory to the destination directory.
-    Uses shutil.copytree with dirs_exist_ok=True (requires Python 3.8+).
+    Copies the contents of the source directory to the destination directory,
+    hard-linking files instead of duplicating their data where possible.
     """
     if os.path.exists(src):
-        shutil.copytree(src, dst, dirs_exist_ok=True)
+        fast_copytree(src, dst)
         slow_log(f"Copied contents from {src} to {dst}.")
     else:
         slow_log(f"Source directory {src} not found.")
@@ -356,25 +710,36 @@ def prompt_and_download_assets():
         slow_log("Skipping download of shaders and textures.")
         return
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        download_and_extract_zip(ZIP_URL, temp_dir)
-        extracted_folder = os.path.join(temp_dir, f"reshade-shaders-{COMMIT_HASH}")
+    archive_root = f"reshade-shaders-{COMMIT_HASH}/"
+    if download_shaders and download_textures:
+        # Both directories make up nearly the whole archive, so a ranged fetch would
+        # only add round trips before the same download. Stream everything instead.
+        prefixes = None
+    elif download_shaders:
+        prefixes = (archive_root + "Shaders/",)
+    else:
+        prefixes = (archive_root + "Textures/",)
+
+    # Extract next to the destination directories so files can be hard-linked into place.
+    with tempfile.TemporaryDirectory(dir=PYROCLAST_DIR) as temp_dir:
+        download_and_extract_zip(ZIP_URL, temp_dir, prefixes)
+        extracted_folder = os.path.join(temp_dir, archive_root)
 
         if download_shaders:
             src_shaders = os.path.join(extracted_folder, "Shaders")
-            dst_shaders = os.path.expanduser("~/pyroclast/shaders")
+            dst_shaders = os.path.join(PYROCLAST_DIR, "shaders")
             slow_log(f"Copying shaders from {src_shaders} to {dst_shaders}...")
             copy_directory(src_shaders, dst_shaders)
 
         if download_textures:
             src_textures = os.path.join(extracted_folder, "Textures")
-            dst_textures = os.path.expanduser("~/pyroclast/textures")
+            dst_textures = os.path.join(PYROCLAST_DIR, "textures")
             slow_log(f"Copying textures from {src_textures} to {dst_textures}...")
             copy_directory(src_textures, dst_textures)
 
 
 def main():
-    global SLOW_MODE, CUSTOM_PATH
+    global SLOW_MODE, CUSTOM_PATH, slow_log
 
     parser = argparse.ArgumentParser(description="vkBasalt installer/uninstaller script.")
     parser.add_argument("--slow", "-s", action="store_true", help="Enable slow logging mode")
@@ -391,6 +756,8 @@ def main():
     if SLOW_MODE:
         slow_log("Slow logging mode enabled.")
     else:
+        # Without a delay, slow_log is just print.
+        slow_log = print
         slow_log("Normal logging mode.")
 
     if args.custom_path:
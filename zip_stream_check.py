@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Self-check for the installer's streaming ZIP extraction and HTTP Range client.
+
+Builds small archives shaped like the reshade-shaders download (one with sizes in the
+local headers, one with trailing data descriptors), serves them from a local HTTP
+server and compares what the installer extracts with zipfile.ZipFile.extractall.
+Also checks that member names escaping the extraction directory (Zip Slip) are refused.
+
+Run from the repository root:
+    python3 zip_stream_check.py
+"""
+
+import filecmp
+import http.server
+import importlib.util
+import io
+import os
+import re
+import tempfile
+import threading
+import zipfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = "reshade-shaders-test/"
+SERVER_DEFAULTS = {"ranges": True, "reject_ranges": False, "changing_etag": False, "shift": 0}
+PREFIXES = [(ROOT + "Shaders/",), (ROOT + "Textures/",), (ROOT + "Shaders/", ROOT + "Textures/")]
+
+spec = importlib.util.spec_from_file_location("installer", os.path.join(HERE, "v1.0_Installer.py"))
+installer = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(installer)
+installer.slow_log = lambda message: None
+
+
+class NonSeekable(io.RawIOBase):
+    """Write-only wrapper that forces zipfile to emit data descriptors."""
+
+    def __init__(self, f):
+        self.f = f
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.f.write(data)
+
+
+def build_archive(path, streamed):
+    """Writes a reshade-shaders-like archive, with data descriptors if streamed is True."""
+    with open(path, "wb") as f:
+        with zipfile.ZipFile(NonSeekable(f) if streamed else f, "w", zipfile.ZIP_DEFLATED) as z:
+            z.writestr(ROOT, "")
+            z.writestr(ROOT + "README.md", "readme " * 50)
+            for i in range(60):
+                z.writestr(f"{ROOT}Shaders/sub/effect{i}.fx", f"// shader {i}\n" * (i + 1))
+            for i in range(5):
+                z.writestr(f"{ROOT}Textures/tex{i}.png", os.urandom(30000))
+            z.writestr(ROOT + "Textures/empty/", "")
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Serves files with optional Range/If-Range support, configured through class attributes."""
+
+    directory = None
+    ranges = True  # honour Range requests
+    reject_ranges = False  # answer every Range request with 416
+    changing_etag = False  # report a new ETag on every request
+    shift = 0  # serve start-end ranges this many bytes off, as if the archive had changed
+    requests = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        Handler.requests += 1
+        with open(os.path.join(self.directory, self.path.lstrip("/")), "rb") as f:
+            data = f.read()
+        etag = f'"{Handler.requests}"' if self.changing_etag else '"fixed"'
+        byte_range = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if self.reject_ranges and byte_range:
+            self.send_error(416)
+            return
+        if self.ranges and byte_range and (if_range is None or if_range == etag):
+            start, end = re.match(r"bytes=(\d*)-(\d*)", byte_range).groups()
+            if start == "":
+                start, end = max(0, len(data) - int(end)), len(data) - 1
+            else:
+                start, end = int(start) + self.shift, (int(end) if end else len(data) - 1) + self.shift
+            body = data[start:end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{start + len(body) - 1}/{len(data)}")
+        else:
+            body = data
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def assert_same_tree(left, right):
+    """Asserts that two directory trees hold the same files with the same contents."""
+    comparison = filecmp.dircmp(left, right)
+    pending = [comparison]
+    while pending:
+        current = pending.pop()
+        assert not (current.left_only or current.right_only or current.diff_files), (
+            current.left, current.left_only, current.right_only, current.diff_files)
+        _, mismatch, errors = filecmp.cmpfiles(current.left, current.right, current.common_files, shallow=False)
+        assert not (mismatch or errors), (current.left, mismatch, errors)
+        pending.extend(current.subdirs.values())
+
+
+def expected_tree(archive, prefixes, target):
+    """Extracts the members under prefixes (or everything) with zipfile as the reference."""
+    with zipfile.ZipFile(archive) as z:
+        names = [name for name in z.namelist() if prefixes is None or name.startswith(prefixes)]
+        z.extractall(target, names)
+
+
+def check(url, archive, prefixes):
+    with tempfile.TemporaryDirectory() as got, tempfile.TemporaryDirectory() as want:
+        installer.download_and_extract_zip(url, got, prefixes)
+        expected_tree(archive, prefixes, want)
+        assert_same_tree(got, want)
+
+
+def zip_with(names):
+    """Returns an in-memory archive holding the given member names."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        for name in names:
+            z.writestr(name, "" if name.endswith("/") else "x")
+    return io.BytesIO(buffer.getvalue())
+
+
+def check_zip_slip():
+    with tempfile.TemporaryDirectory() as parent, tempfile.TemporaryDirectory() as outside:
+        target = os.path.join(parent, "extract")
+        os.mkdir(target)
+        # An absolute path into a scratch directory stands in for names like /etc/passwd,
+        # so a regression cannot overwrite real system files.
+        escaping = ["../x", "a/../../x", os.path.join(outside, "passwd"), "../extract2/x"]
+        for name in escaping:
+            try:
+                installer.extract_zip_stream(zip_with([name]), target)
+            except zipfile.BadZipFile:
+                continue
+            raise AssertionError(f"{name} was extracted outside of {target}")
+        assert os.listdir(parent) == ["extract"] and not os.listdir(outside)
+        assert not os.listdir(target)
+
+        installer.extract_zip_stream(zip_with(["./", "a/../", "a/b.txt"]), target)
+        with open(os.path.join(target, "a", "b.txt")) as f:
+            assert f.read() == "x"
+    print("ok: zip slip")
+
+
+def main():
+    check_zip_slip()
+
+    with tempfile.TemporaryDirectory() as served:
+        archives = {}
+        for name, streamed in (("plain.zip", False), ("descriptors.zip", True)):
+            archives[name] = os.path.join(served, name)
+            build_archive(archives[name], streamed)
+        with zipfile.ZipFile(archives["descriptors.zip"]) as z:
+            assert all(info.flag_bits & 0x08 for info in z.infolist())
+
+        Handler.directory = served
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}/"
+
+        modes = {
+            "range": {},
+            "no range": {"ranges": False},
+            "range rejected with 416": {"reject_ranges": True},
+            "changing etag": {"changing_etag": True},
+            "shifted range": {"shift": 7},
+        }
+        try:
+            for mode, settings in modes.items():
+                for attribute, value in {**SERVER_DEFAULTS, **settings}.items():
+                    setattr(Handler, attribute, value)
+                for name, archive in archives.items():
+                    for prefixes in [None] + PREFIXES:
+                        check(base + name, archive, prefixes)
+                print(f"ok: {mode}")
+        finally:
+            server.shutdown()
+
+    print("All checks passed.")
+
+
+if __name__ == "__main__":
+    main()